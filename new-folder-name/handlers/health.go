@@ -3,6 +3,7 @@ package handlers
 import (
 	"context"
 	"net/http"
+	"sync"
 	"time"
 
 	"github.com/franzego/stage04/internal/queue"
@@ -11,11 +12,22 @@ import (
 	"github.com/redis/go-redis/v9"
 )
 
+// probes from several sources (load balancer, orchestrator, docker) can land
+// at once; results are reused for this long, and probes that arrive while a
+// round of checks is running wait for it instead of starting their own
+const healthCacheTTL = time.Second
+
 type HealthHandler struct {
 	queue           *queue.RabbitMqClient
 	redis           *redis.Client
 	userService     *services.UserServiceClient
 	templateService *services.TemplateServiceClient
+
+	// checks is the last round of results, taken at checkedAt; both are
+	// guarded by checksMu
+	checksMu  sync.Mutex
+	checks    map[string]string
+	checkedAt time.Time
 }
 
 func NewHealthHandler(
@@ -33,6 +45,46 @@ func NewHealthHandler(
 }
 
 func (h *HealthHandler) HealthCheck(c *gin.Context) {
+	checks := h.currentChecks()
+
+	// Determine overall status
+	overallStatus := "healthy"
+	for _, status := range checks {
+		if status == "unhealthy" {
+			overallStatus = "unhealthy"
+			break
+		} else if status == "degraded" {
+			overallStatus = "degraded"
+		}
+	}
+
+	statusCode := http.StatusOK
+	if overallStatus == "unhealthy" {
+		statusCode = http.StatusServiceUnavailable
+	}
+
+	c.JSON(statusCode, gin.H{
+		"status":    overallStatus,
+		"timestamp": time.Now().Format(time.RFC3339),
+		"checks":    checks,
+		"version":   "1.0.0",
+	})
+}
+
+// currentChecks returns the last results if they are still fresh and runs a
+// new round otherwise. The lock is held while the checks run, so probes that
+// arrive meanwhile wait and reuse that round.
+func (h *HealthHandler) currentChecks() map[string]string {
+	h.checksMu.Lock()
+	defer h.checksMu.Unlock()
+	if h.checks == nil || time.Since(h.checkedAt) > healthCacheTTL {
+		h.checks = h.runChecks()
+		h.checkedAt = time.Now()
+	}
+	return h.checks
+}
+
+func (h *HealthHandler) runChecks() map[string]string {
 	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
 	defer cancel()
 
@@ -52,40 +104,22 @@ func (h *HealthHandler) HealthCheck(c *gin.Context) {
 		checks["redis"] = "unhealthy"
 	}
 
-	// Check User Service (circuit breaker aware)
-	if _, err := h.userService.ValidateUser(ctx, "health-check"); err == nil {
+	// Check User Service (circuit breaker state only; probing with a fake id
+	// cost a round trip per probe and its 404s counted towards tripping).
+	// "healthy" therefore means recent calls have been succeeding, not that
+	// the service answered just now
+	if h.userService.IsAvailable() {
 		checks["user_service"] = "healthy"
 	} else {
 		checks["user_service"] = "degraded"
 	}
 
-	// Check Template Service (circuit breaker aware)
-	if _, err := h.templateService.ValidateTemplate(ctx, "health-check"); err == nil {
+	// Check Template Service (circuit breaker state only)
+	if h.templateService.IsAvailable() {
 		checks["template_service"] = "healthy"
 	} else {
 		checks["template_service"] = "degraded"
 	}
 
-	// Determine overall status
-	overallStatus := "healthy"
-	for _, status := range checks {
-		if status == "unhealthy" {
-			overallStatus = "unhealthy"
-			break
-		} else if status == "degraded" {
-			overallStatus = "degraded"
-		}
-	}
-
-	statusCode := http.StatusOK
-	if overallStatus == "unhealthy" {
-		statusCode = http.StatusServiceUnavailable
-	}
-
-	c.JSON(statusCode, gin.H{
-		"status":    overallStatus,
-		"timestamp": time.Now().Format(time.RFC3339),
-		"checks":    checks,
-		"version":   "1.0.0",
-	})
+	return checks
 }
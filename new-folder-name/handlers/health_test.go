@@ -0,0 +1,93 @@
+package handlers
+
+import (
+	"context"
+	"encoding/json"
+	"fmt"
+	"net/http"
+	"net/http/httptest"
+	"testing"
+	"time"
+
+	"github.com/franzego/stage04/internal/queue"
+	"github.com/franzego/stage04/internal/services"
+	"github.com/gin-gonic/gin"
+	"github.com/stretchr/testify/assert"
+)
+
+type healthResponse struct {
+	Status string            `json:"status"`
+	Checks map[string]string `json:"checks"`
+}
+
+func getHealth(t *testing.T, router *gin.Engine) healthResponse {
+	req, _ := http.NewRequest("GET", "/health", nil)
+	w := httptest.NewRecorder()
+	router.ServeHTTP(w, req)
+
+	var response healthResponse
+	assert.NoError(t, json.Unmarshal(w.Body.Bytes(), &response))
+	return response
+}
+
+// tripBreaker fails enough calls against the user service to open its breaker
+func tripBreaker(userService *services.UserServiceClient) {
+	for i := 0; i < 3; i++ {
+		userService.ValidateUser(context.Background(), fmt.Sprintf("user-%d", i))
+	}
+}
+
+func TestHealthCheck_OpenBreakerIsDegraded(t *testing.T) {
+	gin.SetMode(gin.TestMode)
+
+	upstream := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.WriteHeader(http.StatusInternalServerError)
+	}))
+	defer upstream.Close()
+	mockRedis := setupMockRedis()
+	defer mockRedis.Close()
+
+	userService := services.NewUserServiceClient(upstream.URL, false)
+	templateService := services.NewTemplateClient(upstream.URL, false)
+	tripBreaker(userService)
+	assert.False(t, userService.IsAvailable())
+	assert.True(t, templateService.IsAvailable())
+
+	handler := NewHealthHandler(&queue.RabbitMqClient{}, mockRedis, userService, templateService)
+	router := gin.New()
+	router.GET("/health", handler.HealthCheck)
+
+	response := getHealth(t, router)
+	assert.Equal(t, "degraded", response.Checks["user_service"])
+	assert.Equal(t, "healthy", response.Checks["template_service"])
+	assert.Equal(t, "healthy", response.Checks["redis"])
+}
+
+func TestHealthCheck_ResultsCachedBriefly(t *testing.T) {
+	gin.SetMode(gin.TestMode)
+
+	upstream := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.WriteHeader(http.StatusInternalServerError)
+	}))
+	defer upstream.Close()
+	mockRedis := setupMockRedis()
+	defer mockRedis.Close()
+
+	userService := services.NewUserServiceClient(upstream.URL, false)
+	templateService := services.NewTemplateClient(upstream.URL, false)
+
+	handler := NewHealthHandler(&queue.RabbitMqClient{}, mockRedis, userService, templateService)
+	router := gin.New()
+	router.GET("/health", handler.HealthCheck)
+
+	// Step 1: First probe sees a closed breaker
+	assert.Equal(t, "healthy", getHealth(t, router).Checks["user_service"])
+
+	// Step 2: A probe inside the cache window reuses the earlier result
+	tripBreaker(userService)
+	assert.Equal(t, "healthy", getHealth(t, router).Checks["user_service"])
+
+	// Step 3: Once the window passes the open breaker is reported
+	time.Sleep(healthCacheTTL + 100*time.Millisecond)
+	assert.Equal(t, "degraded", getHealth(t, router).Checks["user_service"])
+}
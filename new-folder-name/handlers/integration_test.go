@@ -133,8 +133,8 @@ func TestIntegration_PushNotificationFullFlow(t *testing.T) {
 	mockQueue.AssertExpectations(t)
 }
 
-// TestIntegration_IdempotencyCheck tests that duplicate notifications are handled correctly
-func TestIntegration_IdempotencyCheck(t *testing.T) {
+// TestIntegration_SingleSendCallsEachDependencyOnce tests that one send calls each dependency exactly once
+func TestIntegration_SingleSendCallsEachDependencyOnce(t *testing.T) {
 	gin.SetMode(gin.TestMode)
 
 	mockQueue := new(MockRabbitMQClient)
@@ -158,12 +158,12 @@ func TestIntegration_IdempotencyCheck(t *testing.T) {
 	router.POST("/api/v1/notification/email", handler.SendEmail)
 
 	emailReq := models.SendEmailRequest{
-		UserID:     "user-idempotent",
-		TemplateID: "template-idempotent",
+		UserID:     "user-single-send",
+		TemplateID: "template-single-send",
 	}
 	body, _ := json.Marshal(emailReq)
 
-	// First request
+	// Send a single request
 	req1, _ := http.NewRequest("POST", "/api/v1/notification/email", bytes.NewBuffer(body))
 	req1.Header.Set("Content-Type", "application/json")
 	w1 := httptest.NewRecorder()
@@ -173,7 +173,7 @@ func TestIntegration_IdempotencyCheck(t *testing.T) {
 	var resp1 models.APIResponse
 	json.Unmarshal(w1.Body.Bytes(), &resp1)
 
-	// Verify all mocks were called once for first request
+	// Verify each dependency was called exactly once
 	mockUserService.AssertNumberOfCalls(t, "ValidateUser", 1)
 	mockTemplateService.AssertNumberOfCalls(t, "ValidateTemplate", 1)
 	mockQueue.AssertNumberOfCalls(t, "PublishEmail", 1)
@@ -235,6 +235,107 @@ func TestIntegration_GetNotificationStatus(t *testing.T) {
 	assert.Equal(t, "queued", statusData["status"])
 }
 
+// TestIntegration_GetStatusNotModified tests conditional status retrieval with ETag
+func TestIntegration_GetStatusNotModified(t *testing.T) {
+	gin.SetMode(gin.TestMode)
+
+	mockQueue := new(MockRabbitMQClient)
+	mockRedis := setupMockRedis()
+	defer mockRedis.Close()
+	mockUserService := new(MockUserService)
+	mockTemplateService := new(MockTemplateService)
+
+	handler := NewNotificationService(
+		mockQueue,
+		mockRedis,
+		mockUserService,
+		mockTemplateService,
+	)
+
+	statusData := models.NotificationStatus{
+		ID:        "etag-notif-id",
+		Type:      "email",
+		Status:    "queued",
+		CreatedAt: time.Now(),
+		UpdatedAt: time.Now(),
+	}
+	statusJSON, _ := json.Marshal(statusData)
+	mockRedis.Set(context.Background(), "notification:status:etag-notif-id", statusJSON, 24*time.Hour)
+
+	router := gin.New()
+	router.GET("/api/v1/notification/status/:id", handler.GetStatus)
+
+	// Step 1: First request returns the body with an ETag
+	req, _ := http.NewRequest("GET", "/api/v1/notification/status/etag-notif-id", nil)
+	w := httptest.NewRecorder()
+	router.ServeHTTP(w, req)
+
+	assert.Equal(t, http.StatusOK, w.Code)
+	etag := w.Header().Get("ETag")
+	assert.NotEmpty(t, etag)
+
+	// Step 2: Repeating the request with If-None-Match returns 304 and no body
+	req2, _ := http.NewRequest("GET", "/api/v1/notification/status/etag-notif-id", nil)
+	req2.Header.Set("If-None-Match", etag)
+	w2 := httptest.NewRecorder()
+	router.ServeHTTP(w2, req2)
+
+	assert.Equal(t, http.StatusNotModified, w2.Code)
+	assert.Empty(t, w2.Body.Bytes())
+
+	// Step 3: A list of tags, including a weak one, matches as well
+	reqList, _ := http.NewRequest("GET", "/api/v1/notification/status/etag-notif-id", nil)
+	reqList.Header.Set("If-None-Match", `"stale-tag", W/`+etag)
+	wList := httptest.NewRecorder()
+	router.ServeHTTP(wList, reqList)
+
+	assert.Equal(t, http.StatusNotModified, wList.Code)
+
+	// Step 4: A status change produces a new ETag
+	statusData.Status = "sent"
+	statusJSON, _ = json.Marshal(statusData)
+	mockRedis.Set(context.Background(), "notification:status:etag-notif-id", statusJSON, 24*time.Hour)
+
+	req3, _ := http.NewRequest("GET", "/api/v1/notification/status/etag-notif-id", nil)
+	req3.Header.Set("If-None-Match", etag)
+	w3 := httptest.NewRecorder()
+	router.ServeHTTP(w3, req3)
+
+	assert.Equal(t, http.StatusOK, w3.Code)
+	assert.NotEqual(t, etag, w3.Header().Get("ETag"))
+}
+
+// TestIntegration_GetStatusCorruptRecordHasNoETag tests that error responses carry no ETag
+func TestIntegration_GetStatusCorruptRecordHasNoETag(t *testing.T) {
+	gin.SetMode(gin.TestMode)
+
+	mockQueue := new(MockRabbitMQClient)
+	mockRedis := setupMockRedis()
+	defer mockRedis.Close()
+	mockUserService := new(MockUserService)
+	mockTemplateService := new(MockTemplateService)
+
+	handler := NewNotificationService(
+		mockQueue,
+		mockRedis,
+		mockUserService,
+		mockTemplateService,
+	)
+
+	mockRedis.Set(context.Background(), "notification:status:corrupt-id", "{not json", 24*time.Hour)
+
+	router := gin.New()
+	router.GET("/api/v1/notification/status/:id", handler.GetStatus)
+
+	req, _ := http.NewRequest("GET", "/api/v1/notification/status/corrupt-id", nil)
+	req.Header.Set("If-None-Match", "*")
+	w := httptest.NewRecorder()
+	router.ServeHTTP(w, req)
+
+	assert.Equal(t, http.StatusInternalServerError, w.Code)
+	assert.Empty(t, w.Header().Get("ETag"))
+}
+
 // TestIntegration_InvalidUserValidation tests validation failure for invalid user
 func TestIntegration_InvalidUserValidation(t *testing.T) {
 	gin.SetMode(gin.TestMode)
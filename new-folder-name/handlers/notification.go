@@ -4,8 +4,10 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
+	"hash/fnv"
 	"log"
 	"net/http"
+	"strings"
 	"time"
 
 	"github.com/franzego/stage04/internal/models"
@@ -58,7 +60,6 @@ func (n *NotificationHandler) SendEmail(c *gin.Context) {
 	ctx := context.Background()
 	correlationIDVal, _ := c.Get("correlation_id")
 	correlationID, _ := correlationIDVal.(string)
-	now := time.Now()
 	// parse the req
 	var req models.SendEmailRequest
 	if err := c.ShouldBindJSON(&req); err != nil {
@@ -69,24 +70,10 @@ func (n *NotificationHandler) SendEmail(c *gin.Context) {
 		})
 		return
 	}
-	notificationID := uuid.New().String()
-	isDuplicate, err := n.CheckIdempoteny(ctx, notificationID)
-	if err != nil {
-		log.Printf("idempotency check failed:%v", err)
-	}
-	if isDuplicate {
-		c.JSON(http.StatusOK, models.APIResponse{
-			Success: true,
-			Error:   err.Error(),
-			Message: "Notification Already Processed",
-			Data: models.NotificationResponse{
-				NotificationID: notificationID,
-				Status:         "processing",
-				QueuedAt:       now,
-			},
-		})
-		return
-	}
+	// the id is generated fresh for every request, so it can never collide
+	// with an earlier one; there is nothing to deduplicate against.
+	// v7 ids are time-ordered, which keeps downstream indexes on them compact
+	notificationID := uuid.Must(uuid.NewV7()).String()
 	valUser, err := n.userService.ValidateUser(ctx, req.UserID)
 	if err != nil || !valUser {
 		c.JSON(http.StatusBadRequest, models.APIResponse{
@@ -140,7 +127,6 @@ func (n *NotificationHandler) SendPush(c *gin.Context) {
 	ctx := context.Background()
 	correlationIDVal, _ := c.Get("correlation_id")
 	correlationID, _ := correlationIDVal.(string)
-	now := time.Now()
 	var req models.SendPushRequest
 	if err := c.ShouldBindJSON(&req); err != nil {
 		c.JSON(http.StatusBadRequest, models.APIResponse{
@@ -150,24 +136,10 @@ func (n *NotificationHandler) SendPush(c *gin.Context) {
 		})
 		return
 	}
-	notificationID := uuid.New().String()
-	isDuplicate, err := n.CheckIdempoteny(ctx, notificationID)
-	if err != nil {
-		log.Printf("idempotency check failed:%v", err)
-	}
-	if isDuplicate {
-		c.JSON(http.StatusOK, models.APIResponse{
-			Success: true,
-			Error:   err.Error(),
-			Message: "Notification Already Processed",
-			Data: models.NotificationResponse{
-				NotificationID: notificationID,
-				Status:         "processing",
-				QueuedAt:       now,
-			},
-		})
-		return
-	}
+	// the id is generated fresh for every request, so it can never collide
+	// with an earlier one; there is nothing to deduplicate against.
+	// v7 ids are time-ordered, which keeps downstream indexes on them compact
+	notificationID := uuid.Must(uuid.NewV7()).String()
 	valUser, err := n.userService.ValidateUser(ctx, req.UserID)
 	if err != nil || !valUser {
 		c.JSON(http.StatusBadRequest, models.APIResponse{
@@ -216,19 +188,6 @@ func (n *NotificationHandler) SendPush(c *gin.Context) {
 		},
 	})
 
-}
-func (n *NotificationHandler) CheckIdempoteny(ctx context.Context, notificationID string) (bool, error) {
-	key := fmt.Sprintf("notification:idempotency:%s", notificationID)
-	exists, err := n.redis.Exists(ctx, key).Result()
-	if err != nil {
-		return false, nil
-	}
-	if exists > 0 {
-		return true, nil
-	}
-	err = n.redis.Set(ctx, key, "processing", 24*time.Hour).Err()
-	return false, err
-
 }
 func (n *NotificationHandler) storeNotificationStatus(ctx context.Context, notificationID, status, notifType string) error {
 	statusData := models.NotificationStatus{
@@ -262,7 +221,7 @@ func (n *NotificationHandler) GetStatus(c *gin.Context) {
 
 	// Get status from Redis
 	statusKey := fmt.Sprintf("notification:status:%s", notificationID)
-	statusJSON, err := n.redis.Get(ctx, statusKey).Result()
+	statusJSON, err := n.redis.Get(ctx, statusKey).Bytes()
 	if err == redis.Nil {
 		c.JSON(http.StatusNotFound, models.APIResponse{
 			Success: false,
@@ -282,7 +241,7 @@ func (n *NotificationHandler) GetStatus(c *gin.Context) {
 	}
 
 	var status models.NotificationStatus
-	if err := json.Unmarshal([]byte(statusJSON), &status); err != nil {
+	if err := json.Unmarshal(statusJSON, &status); err != nil {
 		log.Print("Failed to unmarshal status")
 		c.JSON(http.StatusInternalServerError, models.APIResponse{
 			Success: false,
@@ -292,9 +251,41 @@ func (n *NotificationHandler) GetStatus(c *gin.Context) {
 		return
 	}
 
+	// the stored record is rewritten on every status change, so a hash of it
+	// is a cheap etag that lets pollers skip the body when nothing moved.
+	// Only valid records get one, so an error response is never cached.
+	etag := statusETag(statusJSON)
+	c.Header("ETag", etag)
+	if etagMatches(c.GetHeader("If-None-Match"), etag) {
+		c.Status(http.StatusNotModified)
+		return
+	}
+
 	c.JSON(http.StatusOK, models.APIResponse{
 		Success: true,
 		Message: "Status retrieved successfully",
 		Data:    status,
 	})
 }
+
+func statusETag(statusJSON []byte) string {
+	h := fnv.New64a()
+	h.Write(statusJSON)
+	return fmt.Sprintf("\"%x\"", h.Sum64())
+}
+
+// etagMatches applies the If-None-Match weak comparison from RFC 9110
+// section 13.1.2: the header is "*" or a comma-separated list of tags, any of
+// which may carry a W/ prefix.
+func etagMatches(ifNoneMatch, etag string) bool {
+	if strings.TrimSpace(ifNoneMatch) == "*" {
+		return true
+	}
+	for _, candidate := range strings.Split(ifNoneMatch, ",") {
+		candidate = strings.TrimPrefix(strings.TrimSpace(candidate), "W/")
+		if candidate == etag {
+			return true
+		}
+	}
+	return false
+}
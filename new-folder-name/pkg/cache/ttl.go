@@ -0,0 +1,55 @@
+package cache
+
+import (
+	"sync"
+	"time"
+)
+
+type entry[V any] struct {
+	value     V
+	expiresAt time.Time
+}
+
+// TTLCache is a small in-process cache whose entries expire after a fixed
+// duration. It is safe for concurrent use.
+type TTLCache[V any] struct {
+	mu        sync.RWMutex
+	ttl       time.Duration
+	entries   map[string]entry[V]
+	lastSweep time.Time
+}
+
+func NewTTLCache[V any](ttl time.Duration) *TTLCache[V] {
+	return &TTLCache[V]{
+		ttl:       ttl,
+		entries:   make(map[string]entry[V]),
+		lastSweep: time.Now(),
+	}
+}
+
+func (c *TTLCache[V]) Get(key string) (V, bool) {
+	c.mu.RLock()
+	e, ok := c.entries[key]
+	c.mu.RUnlock()
+	if !ok || time.Now().After(e.expiresAt) {
+		var zero V
+		return zero, false
+	}
+	return e.value, true
+}
+
+func (c *TTLCache[V]) Set(key string, value V) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	now := time.Now()
+	// drop expired entries once per ttl so the map does not grow unbounded
+	if now.Sub(c.lastSweep) > c.ttl {
+		for k, e := range c.entries {
+			if now.After(e.expiresAt) {
+				delete(c.entries, k)
+			}
+		}
+		c.lastSweep = now
+	}
+	c.entries[key] = entry[V]{value: value, expiresAt: now.Add(c.ttl)}
+}
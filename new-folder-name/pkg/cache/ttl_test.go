@@ -0,0 +1,30 @@
+package cache
+
+import (
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestTTLCache_GetSet(t *testing.T) {
+	c := NewTTLCache[bool](time.Minute)
+
+	_, ok := c.Get("missing")
+	assert.False(t, ok)
+
+	c.Set("welcome-template", true)
+	value, ok := c.Get("welcome-template")
+	assert.True(t, ok)
+	assert.True(t, value)
+}
+
+func TestTTLCache_Expiry(t *testing.T) {
+	c := NewTTLCache[bool](10 * time.Millisecond)
+
+	c.Set("welcome-template", true)
+	time.Sleep(20 * time.Millisecond)
+
+	_, ok := c.Get("welcome-template")
+	assert.False(t, ok)
+}
@@ -0,0 +1,36 @@
+package services
+
+import (
+	"io"
+	"net/http"
+	"time"
+)
+
+// every notification makes a call to each upstream, so keep enough idle
+// connections around to reuse them instead of opening a new one per request
+// (the default transport keeps only 2 per host)
+const maxIdleConnsPerHost = 64
+
+// total idle cap for one client's transport; each client talks to a single
+// upstream, so this only has to be at least maxIdleConnsPerHost
+const maxIdleConns = 64
+
+// upstream bodies are never used, only drained so the connection can be
+// reused; anything larger than this is cheaper to drop with the connection
+const maxDrainBytes = 4 << 10
+
+func newHTTPClient() *http.Client {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConns = maxIdleConns
+	transport.MaxIdleConnsPerHost = maxIdleConnsPerHost
+	return &http.Client{
+		Timeout:   5 * time.Second,
+		Transport: transport,
+	}
+}
+
+// drainBody reads what is left of a response body, up to maxDrainBytes, so
+// the transport can return the connection to the idle pool on Close
+func drainBody(body io.Reader) {
+	_, _ = io.Copy(io.Discard, io.LimitReader(body, maxDrainBytes))
+}
@@ -7,25 +7,30 @@ import (
 	"net/http"
 	"time"
 
+	"github.com/franzego/stage04/pkg/cache"
 	"github.com/franzego/stage04/pkg/circuitbreaker"
 	"github.com/sony/gobreaker"
 )
 
+// templates rarely change once published, so a short ttl is enough to keep
+// hot template ids off the network without serving stale results for long
+const templateCacheTTL = time.Minute
+
 type TemplateServiceClient struct {
 	baseUrl    string
 	httpClient *http.Client
 	cb         *gobreaker.CircuitBreaker
 	mockMode   bool
+	validated  *cache.TTLCache[bool]
 }
 
 func NewTemplateClient(baseUrl string, mockmode bool) *TemplateServiceClient {
 	return &TemplateServiceClient{
-		baseUrl: baseUrl,
-		httpClient: &http.Client{
-			Timeout: 5 * time.Second,
-		},
-		cb:       circuitbreaker.NewCircuitBreaker("template-service"),
-		mockMode: mockmode,
+		baseUrl:    baseUrl,
+		httpClient: newHTTPClient(),
+		cb:         circuitbreaker.NewCircuitBreaker("template-service"),
+		mockMode:   mockmode,
+		validated:  cache.NewTTLCache[bool](templateCacheTTL),
 	}
 }
 func (t *TemplateServiceClient) ValidateTemplate(ctx context.Context, templateID string) (bool, error) {
@@ -33,8 +38,16 @@ func (t *TemplateServiceClient) ValidateTemplate(ctx context.Context, templateID
 		log.Print("Mock mode enabled: Simulating template validation")
 		return true, nil
 	}
+	return cachedValidation(t.validated, templateID, func() (bool, error) {
+		return t.lookup(ctx, templateID)
+	})
+}
+
+func (t *TemplateServiceClient) lookup(ctx context.Context, templateID string) (bool, error) {
 	result, err := t.cb.Execute(func() (interface{}, error) {
-		req, err := http.NewRequestWithContext(ctx, "GET",
+		// only existence matters here, so HEAD avoids pulling the template
+		// body (subject and content) over the wire on every validation
+		req, err := http.NewRequestWithContext(ctx, http.MethodHead,
 			fmt.Sprintf("%s/templates/%s", t.baseUrl, templateID), nil)
 		if err != nil {
 			return false, err
@@ -45,6 +58,7 @@ func (t *TemplateServiceClient) ValidateTemplate(ctx context.Context, templateID
 			return false, err
 		}
 		defer resp.Body.Close()
+		drainBody(resp.Body)
 
 		if resp.StatusCode == http.StatusOK {
 			return true, nil
@@ -58,3 +72,10 @@ func (t *TemplateServiceClient) ValidateTemplate(ctx context.Context, templateID
 	return result.(bool), nil
 
 }
+
+// IsAvailable reports whether the circuit breaker currently lets calls to the
+// template service through. It makes no network call, so it is cheap enough for
+// liveness probes.
+func (t *TemplateServiceClient) IsAvailable() bool {
+	return t.mockMode || t.cb.State() != gobreaker.StateOpen
+}
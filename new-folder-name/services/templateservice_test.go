@@ -0,0 +1,55 @@
+package services
+
+import (
+	"context"
+	"net/http"
+	"net/http/httptest"
+	"sync/atomic"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+// newCountingServer answers every request with status and counts how many
+// requests reached it.
+func newCountingServer(status int) (*httptest.Server, *int32) {
+	var hits int32
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		atomic.AddInt32(&hits, 1)
+		w.WriteHeader(status)
+	}))
+	return server, &hits
+}
+
+func TestValidateTemplate_CachesSuccess(t *testing.T) {
+	server, hits := newCountingServer(http.StatusOK)
+	defer server.Close()
+	client := NewTemplateClient(server.URL, false)
+
+	for i := 0; i < 2; i++ {
+		valid, err := client.ValidateTemplate(context.Background(), "welcome-template")
+		assert.NoError(t, err)
+		assert.True(t, valid)
+	}
+
+	assert.Equal(t, int32(1), atomic.LoadInt32(hits))
+}
+
+func TestValidateTemplate_SendsHead(t *testing.T) {
+	var method string
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		method = r.Method
+		if r.Method != http.MethodHead {
+			w.WriteHeader(http.StatusMethodNotAllowed)
+			return
+		}
+		w.WriteHeader(http.StatusOK)
+	}))
+	defer server.Close()
+	client := NewTemplateClient(server.URL, false)
+
+	valid, err := client.ValidateTemplate(context.Background(), "welcome-template")
+	assert.NoError(t, err)
+	assert.True(t, valid)
+	assert.Equal(t, http.MethodHead, method)
+}
@@ -7,25 +7,30 @@ import (
 	"net/http"
 	"time"
 
+	"github.com/franzego/stage04/pkg/cache"
 	"github.com/franzego/stage04/pkg/circuitbreaker"
 	"github.com/sony/gobreaker"
 )
 
+// user records can be disabled at any time, so keep this shorter than the
+// template cache
+const userCacheTTL = 30 * time.Second
+
 type UserServiceClient struct {
 	baseURL    string
 	httpClient *http.Client
 	cb         *gobreaker.CircuitBreaker
 	mockMode   bool
+	validated  *cache.TTLCache[bool]
 }
 
 func NewUserServiceClient(baseURL string, mockMode bool) *UserServiceClient {
 	return &UserServiceClient{
-		baseURL: baseURL,
-		httpClient: &http.Client{
-			Timeout: 5 * time.Second,
-		},
-		cb:       circuitbreaker.NewCircuitBreaker("user-service"),
-		mockMode: mockMode,
+		baseURL:    baseURL,
+		httpClient: newHTTPClient(),
+		cb:         circuitbreaker.NewCircuitBreaker("user-service"),
+		mockMode:   mockMode,
+		validated:  cache.NewTTLCache[bool](userCacheTTL),
 	}
 }
 
@@ -35,7 +40,12 @@ func (u *UserServiceClient) ValidateUser(ctx context.Context, userID string) (bo
 		log.Print("Mock mode enabled: Simulating user validation")
 		return true, nil
 	}
+	return cachedValidation(u.validated, userID, func() (bool, error) {
+		return u.lookup(ctx, userID)
+	})
+}
 
+func (u *UserServiceClient) lookup(ctx context.Context, userID string) (bool, error) {
 	result, err := u.cb.Execute(func() (interface{}, error) {
 		req, err := http.NewRequestWithContext(ctx, "GET",
 			fmt.Sprintf("%s/users/%s", u.baseURL, userID), nil)
@@ -48,6 +58,7 @@ func (u *UserServiceClient) ValidateUser(ctx context.Context, userID string) (bo
 			return false, err
 		}
 		defer resp.Body.Close()
+		drainBody(resp.Body)
 
 		if resp.StatusCode == http.StatusOK {
 			return true, nil
@@ -58,6 +69,12 @@ func (u *UserServiceClient) ValidateUser(ctx context.Context, userID string) (bo
 	if err != nil {
 		return false, err
 	}
-
 	return result.(bool), nil
 }
+
+// IsAvailable reports whether the circuit breaker currently lets calls to the
+// user service through. It makes no network call, so it is cheap enough for
+// liveness probes.
+func (u *UserServiceClient) IsAvailable() bool {
+	return u.mockMode || u.cb.State() != gobreaker.StateOpen
+}
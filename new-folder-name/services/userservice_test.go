@@ -0,0 +1,40 @@
+package services
+
+import (
+	"context"
+	"net/http"
+	"sync/atomic"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestValidateUser_CachesSuccess(t *testing.T) {
+	server, hits := newCountingServer(http.StatusOK)
+	defer server.Close()
+	client := NewUserServiceClient(server.URL, false)
+
+	for i := 0; i < 2; i++ {
+		valid, err := client.ValidateUser(context.Background(), "user-123")
+		assert.NoError(t, err)
+		assert.True(t, valid)
+	}
+
+	assert.Equal(t, int32(1), atomic.LoadInt32(hits))
+}
+
+func TestUserService_IsAvailable(t *testing.T) {
+	server, _ := newCountingServer(http.StatusInternalServerError)
+	defer server.Close()
+
+	assert.True(t, NewUserServiceClient(server.URL, true).IsAvailable())
+
+	client := NewUserServiceClient(server.URL, false)
+	assert.True(t, client.IsAvailable())
+
+	// three straight failures trip the breaker (see circuitbreaker.NewCircuitBreaker)
+	for i := 0; i < 3; i++ {
+		client.ValidateUser(context.Background(), "user-123")
+	}
+	assert.False(t, client.IsAvailable())
+}
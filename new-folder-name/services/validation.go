@@ -0,0 +1,18 @@
+package services
+
+import "github.com/franzego/stage04/pkg/cache"
+
+// cachedValidation answers from validated for ids that recently passed and
+// otherwise runs lookup. Only successful lookups are cached, so misses and
+// upstream errors always go back to the service.
+func cachedValidation(validated *cache.TTLCache[bool], id string, lookup func() (bool, error)) (bool, error) {
+	if _, ok := validated.Get(id); ok {
+		return true, nil
+	}
+	valid, err := lookup()
+	if err != nil || !valid {
+		return false, err
+	}
+	validated.Set(id, true)
+	return true, nil
+}
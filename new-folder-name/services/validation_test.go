@@ -0,0 +1,42 @@
+package services
+
+import (
+	"errors"
+	"testing"
+	"time"
+
+	"github.com/franzego/stage04/pkg/cache"
+	"github.com/stretchr/testify/assert"
+)
+
+func TestCachedValidation(t *testing.T) {
+	tests := []struct {
+		name          string
+		valid         bool
+		err           error
+		expectedCalls int
+	}{
+		{name: "success is cached", valid: true, expectedCalls: 1},
+		{name: "not found is not cached", valid: false, expectedCalls: 2},
+		{name: "upstream error is not cached", valid: false, err: errors.New("upstream unavailable"), expectedCalls: 2},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			validated := cache.NewTTLCache[bool](time.Minute)
+			calls := 0
+			lookup := func() (bool, error) {
+				calls++
+				return tt.valid, tt.err
+			}
+
+			for i := 0; i < 2; i++ {
+				valid, err := cachedValidation(validated, "id-123", lookup)
+				assert.Equal(t, tt.valid, valid)
+				assert.Equal(t, tt.err, err)
+			}
+
+			assert.Equal(t, tt.expectedCalls, calls)
+		})
+	}
+}